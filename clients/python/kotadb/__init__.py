@@ -27,7 +27,9 @@ from .validated_types import (
 from .validation import ValidationError as ClientValidationError
 
 __version__ = "0.5.0"
+
 __all__ = [
+    "AsyncKotaDB",
     "ClientValidationError",
     "ConnectionError",
     "Document",
@@ -49,3 +51,12 @@ __all__ = [
     "ensure_binary_installed",
     "start_server",
 ]
+
+
+def __getattr__(name):
+    # AsyncKotaDB pulls in aiohttp, so only import it when first requested
+    if name == "AsyncKotaDB":
+        from .async_client import AsyncKotaDB  # noqa: PLC0415
+
+        return AsyncKotaDB
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,211 @@
+"""
+KotaDB Async Python Client
+
+Asyncio client for issuing many independent KotaDB requests concurrently.
+Requires the optional ``aiohttp`` dependency (``pip install kotadb-client[async]``).
+"""
+
+import asyncio
+from typing import Any, Dict, Optional, Union
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+from .client import KotaDB
+from .exceptions import ConnectionError, NotFoundError, ServerError
+from .serialization import JSON_CONTENT_TYPE, JSON_HEADERS, json_dumps, json_loads
+from .types import CreateDocumentRequest, Document, DocumentDict, QueryResult
+
+
+class AsyncKotaDB:
+    """
+    Asynchronous KotaDB client backed by a single aiohttp session.
+
+    Independent calls can be awaited together so their latencies overlap
+    instead of adding up.
+
+    Example:
+        async with AsyncKotaDB("http://localhost:8080") as db:
+            docs = await asyncio.gather(*(db.get(doc_id) for doc_id in doc_ids))
+            results = await asyncio.gather(db.query("rust"), db.query("python"))
+    """
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        timeout: float = 30,
+        *,
+        pool_maxsize: int = 20,
+        connect_timeout: float = 3.05,
+    ):
+        """
+        Initialize async KotaDB client.
+
+        Unlike KotaDB, no connection test is made here; connection failures
+        surface as ConnectionError on the first request.
+
+        Args:
+            url: Database URL. Can be HTTP URL or kotadb:// connection string.
+                 If None, uses KOTADB_URL environment variable.
+            timeout: Total timeout in seconds for each request.
+            pool_maxsize: Maximum number of concurrent connections.
+            connect_timeout: Timeout in seconds for establishing a connection.
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncKotaDB requires aiohttp. Install with: pip install kotadb-client[async]"
+            )
+
+        self.base_url = KotaDB._parse_url(url)
+        self.timeout = aiohttp.ClientTimeout(total=timeout, sock_connect=connect_timeout)
+        self.pool_maxsize = pool_maxsize
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Return the shared session, creating it inside the running event loop."""
+        if self._session is None or self._session.closed:
+            # aiohttp advertises gzip/deflate (and br with brotli) by default
+            self._session = aiohttp.ClientSession(
+                headers={"Accept": JSON_CONTENT_TYPE},
+                timeout=self.timeout,
+                connector=aiohttp.TCPConnector(limit=self.pool_maxsize),
+            )
+        return self._session
+
+    async def _make_request(self, method: str, endpoint: str, **kwargs) -> Any:
+        """Make an HTTP request with error handling and return the decoded JSON body."""
+        url = f"{self.base_url}{endpoint}"
+
+        # Encode JSON bodies ourselves so the fast serializer is used when available
+        if "json" in kwargs:
+            kwargs["data"] = json_dumps(kwargs.pop("json"))
+            kwargs["headers"] = JSON_HEADERS
+
+        try:
+            async with self._get_session().request(method, url, **kwargs) as response:
+                if response.status == 404:
+                    raise NotFoundError("Resource not found")
+                elif response.status >= 400:
+                    body = await response.read()
+                    text = body.decode("utf-8", errors="replace")
+                    try:
+                        error_data = json_loads(body)
+                        error_msg = error_data.get("error", f"HTTP {response.status}")
+                    except (ValueError, KeyError, AttributeError):
+                        error_msg = f"HTTP {response.status}: {text}"
+                    raise ServerError(error_msg, response.status, text)
+
+                if method == "DELETE":
+                    return None
+                return json_loads(await response.read())
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise ConnectionError(f"Request failed: {e}") from e
+
+    async def query(
+        self, query: str, limit: Optional[int] = None, offset: int = 0, **kwargs
+    ) -> QueryResult:
+        """
+        Search documents using text query.
+
+        Args:
+            query: Search query string
+            limit: Maximum number of results to return
+            offset: Number of results to skip
+            **kwargs: Additional filter parameters (e.g., tag, path)
+
+        Returns:
+            QueryResult with matching documents and metadata
+        """
+        params = KotaDB._query_params(query, limit, offset, kwargs)
+        data = await self._make_request("GET", "/documents/search", params=params)
+        return QueryResult.from_dict(data)
+
+    async def get(self, doc_id: str) -> Document:
+        """
+        Get a document by ID.
+
+        Args:
+            doc_id: Document identifier
+
+        Returns:
+            Document object
+        """
+        data = await self._make_request("GET", f"/documents/{doc_id}")
+        return Document.from_dict(data)
+
+    async def insert(self, document: Union[DocumentDict, CreateDocumentRequest]) -> str:
+        """
+        Insert a new document.
+
+        Args:
+            document: Document data as dict or CreateDocumentRequest
+
+        Returns:
+            ID of the created document
+        """
+        document = KotaDB._to_create_request(document)
+        data = await self._make_request("POST", "/documents", json=document.to_dict())
+        return data["id"]
+
+    async def update(self, doc_id: str, updates: DocumentDict) -> Document:
+        """
+        Update an existing document.
+
+        Args:
+            doc_id: Document identifier
+            updates: Fields to update
+
+        Returns:
+            Updated document
+        """
+        updates = KotaDB._prepare_updates(updates)
+        data = await self._make_request("PUT", f"/documents/{doc_id}", json=updates)
+        return Document.from_dict(data)
+
+    async def delete(self, doc_id: str) -> bool:
+        """
+        Delete a document.
+
+        Args:
+            doc_id: Document identifier
+
+        Returns:
+            True if deletion was successful
+        """
+        await self._make_request("DELETE", f"/documents/{doc_id}")
+        return True
+
+    async def health(self) -> Dict[str, Any]:
+        """
+        Check database health status.
+
+        Returns:
+            Health status information
+        """
+        return await self._make_request("GET", "/health")
+
+    async def stats(self) -> Dict[str, Any]:
+        """
+        Get database statistics.
+
+        Returns:
+            Database statistics
+        """
+        return await self._make_request("GET", "/stats")
+
+    async def close(self) -> None:
+        """Close the client session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "AsyncKotaDB":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit."""
+        await self.close()
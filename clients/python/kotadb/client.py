@@ -4,17 +4,43 @@ KotaDB Python Client
 Main client class for interacting with KotaDB HTTP API.
 """
 
+import dataclasses
 import os
+import threading
 import urllib.parse
-from typing import Any, Dict, List, Optional, Union
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
 from .builders import DocumentBuilder, QueryBuilder, UpdateBuilder
 from .exceptions import ConnectionError, NotFoundError, ServerError, ValidationError
-from .types import CreateDocumentRequest, Document, DocumentDict, QueryResult
+from .serialization import (
+    JSON_CONTENT_TYPE,
+    JSON_HEADERS,
+    MSGPACK_CONTENT_TYPE,
+    MSGPACK_HEADERS,
+    json_dumps,
+    json_loads,
+    msgpack_dumps,
+    msgpack_loads,
+    msgspec,
+)
+from .types import (
+    CreateDocumentRequest,
+    Document,
+    DocumentDict,
+    QueryResult,
+    content_to_bytes,
+)
 
 
 class KotaDB:
@@ -40,32 +66,96 @@ class KotaDB:
         db.delete(doc_id)
     """
 
-    def __init__(self, url: Optional[str] = None, timeout: int = 30, retries: int = 3):
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        timeout: float = 30,
+        retries: int = 3,
+        *,
+        backoff_factor: float = 0.5,
+        pool_connections: int = 10,
+        pool_maxsize: int = 20,
+        cache_size: int = 256,
+        verify_on_connect: bool = True,
+        serializer: str = "json",
+        connect_timeout: float = 3.05,
+    ):
         """
         Initialize KotaDB client.
 
         Args:
             url: Database URL. Can be HTTP URL or kotadb:// connection string.
                  If None, uses KOTADB_URL environment variable.
-            timeout: Request timeout in seconds.
+            timeout: Read timeout in seconds for each request.
             retries: Number of retry attempts for failed requests.
-        """
+            backoff_factor: Base delay in seconds for exponential backoff between
+                 retries (0.5 waits roughly 0.5s, 1s, 2s, ...).
+            pool_connections: Number of per-host connection pools to cache.
+            pool_maxsize: Maximum number of keep-alive connections kept per host.
+            cache_size: Maximum number of documents kept for conditional GETs.
+                 Set to 0 to disable the cache.
+            verify_on_connect: Probe /health before returning. When False, no
+                 request is made here and connection failures surface as
+                 ConnectionError on the first call instead.
+            serializer: Wire format for request bodies, "json" or "msgpack".
+                 MessagePack requires msgspec; if the server rejects it with
+                 415 the client switches back to JSON.
+            connect_timeout: Timeout in seconds for establishing a connection,
+                 so an unreachable server fails fast instead of waiting for
+                 the full read timeout.
+        """
+        if serializer not in ("json", "msgpack"):
+            raise ValidationError(f"Unsupported serializer '{serializer}'")
+        if serializer == "msgpack" and msgspec is None:
+            raise ImportError(
+                "MessagePack support requires msgspec. "
+                "Install with: pip install kotadb-client[msgpack]"
+            )
+
         self.base_url = self._parse_url(url)
         self.timeout = timeout
-
-        # Configure session with retries
+        self.connect_timeout = connect_timeout
+        # (connect, read) pair applied to every request made by this client
+        self._timeouts = (connect_timeout, timeout)
+        self._serializer = serializer
+        self._accept_msgpack = serializer == "msgpack"
+
+        # Configure a single pooled session with retries. All requests share it so
+        # keep-alive connections are reused instead of reconnecting per call.
         self.session = requests.Session()
+        self._pool_maxsize = pool_maxsize
         retry_strategy = Retry(
             total=retries,
+            backoff_factor=backoff_factor,
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE", "POST"],
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry_strategy,
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
+        # requests already advertises every encoding urllib3 can decode
+        # (br/zstd are added when brotli/zstandard are installed)
+        if serializer == "msgpack":
+            self.session.headers["Accept"] = f"{MSGPACK_CONTENT_TYPE}, {JSON_CONTENT_TYPE};q=0.9"
+        else:
+            self.session.headers["Accept"] = JSON_CONTENT_TYPE
+
+        # Cleared on first use if the server has no bulk insert endpoint
+        self._bulk_supported = True
+
+        # LRU of doc_id -> (etag, document), revalidated with If-None-Match
+        self._cache_size = cache_size
+        self._doc_cache: OrderedDict[str, Tuple[str, Document]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
         # Test connection
-        self._test_connection()
+        if verify_on_connect:
+            self._test_connection()
 
     def test_connection(self) -> Dict[str, Any]:
         """
@@ -76,7 +166,29 @@ class KotaDB:
         """
         return self.health()
 
-    def _parse_url(self, url: Optional[str]) -> str:
+    def warmup(self, connections: int = 1) -> None:
+        """
+        Open keep-alive connections ahead of latency-sensitive work.
+
+        Issues concurrent health checks so the pool holds ``connections``
+        established sockets and later requests skip the TCP/TLS handshake.
+        Nagle's algorithm is already disabled on pooled sockets by urllib3.
+
+        Args:
+            connections: Number of connections to establish, e.g. the number
+                 of worker threads that will share this client. Capped at
+                 ``pool_maxsize``, since the pool discards any sockets beyond it.
+        """
+        connections = min(connections, self._pool_maxsize)
+        if connections <= 1:
+            self.health()
+            return
+
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            list(executor.map(lambda _: self.health(), range(connections)))
+
+    @staticmethod
+    def _parse_url(url: Optional[str]) -> str:
         """Parse and normalize the database URL."""
         if url is None:
             url = os.getenv("KOTADB_URL")
@@ -99,7 +211,7 @@ class KotaDB:
     def _test_connection(self):
         """Test connection to the database."""
         try:
-            response = self.session.get(f"{self.base_url}/health", timeout=self.timeout)
+            response = self.session.get(f"{self.base_url}/health", timeout=self._timeouts)
             if response.status_code != 200:
                 raise ConnectionError(f"Health check failed with status {response.status_code}")
         except requests.RequestException as e:
@@ -109,14 +221,25 @@ class KotaDB:
         """Make an HTTP request with error handling."""
         url = f"{self.base_url}{endpoint}"
 
+        # Encode bodies ourselves so the configured (fast) serializer is used
+        body = kwargs.pop("json", None)
+        if body is not None:
+            kwargs["data"], kwargs["headers"] = self._encode(body)
+
         try:
-            response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+            response = self.session.request(method, url, timeout=self._timeouts, **kwargs)
+
+            if response.status_code == 415 and body is not None and self._serializer != "json":
+                # Server does not accept MessagePack bodies; use JSON from now on
+                self._serializer = "json"
+                kwargs["data"], kwargs["headers"] = self._encode(body)
+                response = self.session.request(method, url, timeout=self._timeouts, **kwargs)
 
             if response.status_code == 404:
                 raise NotFoundError("Resource not found")
             elif response.status_code >= 400:
                 try:
-                    error_data = response.json()
+                    error_data = self._decode(response)
                     error_msg = error_data.get("error", f"HTTP {response.status_code}")
                 except (ValueError, KeyError, AttributeError):
                     error_msg = f"HTTP {response.status_code}: {response.text}"
@@ -127,6 +250,27 @@ class KotaDB:
         except requests.RequestException as e:
             raise ConnectionError(f"Request failed: {e}") from e
 
+    def _encode(self, body: Any) -> Tuple[bytes, Dict[str, str]]:
+        """Serialize a request body, returning the bytes and their headers."""
+        try:
+            if self._serializer == "msgpack":
+                return msgpack_dumps(body), MSGPACK_HEADERS
+            return json_dumps(body), JSON_HEADERS
+        except (TypeError, ValueError, OverflowError) as e:
+            raise ValidationError(f"Request body is not serializable: {e}") from e
+
+    def _is_msgpack(self, response: requests.Response) -> bool:
+        """Check whether a response body is MessagePack rather than JSON."""
+        if not self._accept_msgpack:
+            return False
+        return response.headers.get("Content-Type", "").startswith(MSGPACK_CONTENT_TYPE)
+
+    def _decode(self, response: requests.Response) -> Any:
+        """Deserialize a response body according to its Content-Type."""
+        if self._is_msgpack(response):
+            return msgpack_loads(response.content)
+        return json_loads(response.content)
+
     def query(
         self, query: str, limit: Optional[int] = None, offset: int = 0, **kwargs
     ) -> QueryResult:
@@ -142,17 +286,68 @@ class KotaDB:
         Returns:
             QueryResult with matching documents and metadata
         """
-        params = {"q": query}
+        params = self._query_params(query, limit, offset, kwargs)
+        response = self._make_request("GET", "/documents/search", params=params)
+        return QueryResult.from_dict(self._decode(response))
+
+    def query_iter(
+        self, query: str, limit: Optional[int] = None, offset: int = 0, **kwargs
+    ) -> Iterator[Document]:
+        """
+        Search documents, yielding results as they are parsed.
+
+        With the optional ``ijson`` dependency installed the response body is
+        streamed, so only one document is materialized at a time and breaking
+        out of the loop stops reading. Without it the body is parsed in full.
+
+        The request is only sent once iteration starts, so connection and HTTP
+        errors are raised from the first ``next()`` rather than from this call.
+
+        Args:
+            query: Search query string
+            limit: Maximum number of results to return
+            offset: Number of results to skip
+            **kwargs: Additional filter parameters (e.g., tag, path)
+
+        Yields:
+            Matching documents in result order
+        """
+        params = self._query_params(query, limit, offset, kwargs)
+        response = self._make_request("GET", "/documents/search", params=params, stream=True)
+        try:
+            if ijson is None or self._is_msgpack(response):
+                yield from QueryResult.from_dict(self._decode(response)).results
+                return
+
+            response.raw.decode_content = True
+            for doc in self._stream_documents(response.raw):
+                yield Document.from_dict(doc)
+        finally:
+            response.close()
+
+    @staticmethod
+    def _stream_documents(raw: Any) -> Iterator[Dict[str, Any]]:
+        """Stream items of the result array, accepting the same keys as QueryResult."""
+        events = ijson.parse(raw, use_float=True)
+        for prefix, event, value in events:
+            if prefix == "" and event == "map_key" and value in ("documents", "results"):
+                yield from ijson.items(events, f"{value}.item")
+                return
+
+    @staticmethod
+    def _query_params(
+        query: str, limit: Optional[int], offset: int, filters: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Build query string parameters for a text search."""
+        params: Dict[str, Any] = {"q": query}
         if limit:
             params["limit"] = limit
         if offset:
             params["offset"] = offset
 
         # Add any additional filter parameters
-        params.update(kwargs)
-
-        response = self._make_request("GET", "/documents/search", params=params)
-        return QueryResult.from_dict(response.json())
+        params.update(filters)
+        return params
 
     def semantic_search(
         self, query: str, limit: Optional[int] = None, offset: int = 0
@@ -175,7 +370,7 @@ class KotaDB:
             data["offset"] = offset
 
         response = self._make_request("POST", "/search/semantic", json=data)
-        return QueryResult.from_dict(response.json())
+        return QueryResult.from_dict(self._decode(response))
 
     def hybrid_search(
         self, query: str, limit: Optional[int] = None, offset: int = 0, semantic_weight: float = 0.7
@@ -199,20 +394,53 @@ class KotaDB:
             data["offset"] = offset
 
         response = self._make_request("POST", "/search/hybrid", json=data)
-        return QueryResult.from_dict(response.json())
+        return QueryResult.from_dict(self._decode(response))
 
     def get(self, doc_id: str) -> Document:
         """
         Get a document by ID.
 
+        Responses carrying an ETag are cached; repeat reads send If-None-Match
+        and reuse the cached document when the server answers 304.
+
         Args:
             doc_id: Document identifier
 
         Returns:
             Document object
         """
-        response = self._make_request("GET", f"/documents/{doc_id}")
-        return Document.from_dict(response.json())
+        with self._cache_lock:
+            cached = self._doc_cache.get(doc_id)
+
+        headers = {"If-None-Match": cached[0]} if cached else None
+        response = self._make_request("GET", f"/documents/{doc_id}", headers=headers)
+        if cached and response.status_code == 304:
+            with self._cache_lock:
+                if doc_id in self._doc_cache:
+                    self._doc_cache.move_to_end(doc_id)
+            return self._copy_document(cached[1])
+
+        doc = Document.from_dict(self._decode(response))
+        etag = response.headers.get("ETag")
+        if etag and self._cache_size > 0:
+            with self._cache_lock:
+                self._doc_cache[doc_id] = (etag, self._copy_document(doc))
+                self._doc_cache.move_to_end(doc_id)
+                while len(self._doc_cache) > self._cache_size:
+                    self._doc_cache.popitem(last=False)
+        return doc
+
+    @staticmethod
+    def _copy_document(doc: Document) -> Document:
+        """Copy a document so callers cannot mutate the cached instance."""
+        tags = None if doc.tags is None else list(doc.tags)
+        metadata = None if doc.metadata is None else dict(doc.metadata)
+        return dataclasses.replace(doc, tags=tags, metadata=metadata)
+
+    def _invalidate(self, doc_id: str) -> None:
+        """Drop a document from the GET cache."""
+        with self._cache_lock:
+            self._doc_cache.pop(doc_id, None)
 
     def insert(self, document: Union[DocumentDict, CreateDocumentRequest]) -> str:
         """
@@ -224,26 +452,57 @@ class KotaDB:
         Returns:
             ID of the created document
         """
-        if isinstance(document, dict):
-            # Validate required fields
-            required_fields = ["path", "title", "content"]
-            for field in required_fields:
-                if field not in document:
-                    raise ValidationError(f"Required field '{field}' missing")
-
-            # Convert dict to CreateDocumentRequest
-            document = CreateDocumentRequest(
-                path=document["path"],
-                title=document["title"],
-                content=document["content"],
-                tags=document.get("tags"),
-                metadata=document.get("metadata"),
-            )
-
+        document = self._to_create_request(document)
         response = self._make_request("POST", "/documents", json=document.to_dict())
-        result = response.json()
+        result = self._decode(response)
         return result["id"]
 
+    @property
+    def bulk_supported(self) -> bool:
+        """Whether insert_bulk() sends one request; False once the server lacks a bulk endpoint."""
+        return self._bulk_supported
+
+    def insert_bulk(self, documents: List[Union[DocumentDict, CreateDocumentRequest]]) -> List[str]:
+        """
+        Insert several documents in a single request.
+
+        Servers without a bulk endpoint are detected on the first call; the
+        client then falls back to one insert per document over the same
+        pooled session.
+
+        Args:
+            documents: Documents as dicts or CreateDocumentRequest objects
+
+        Returns:
+            IDs of the created documents, in input order
+        """
+        create_requests = [self._to_create_request(document) for document in documents]
+        if not create_requests:
+            return []
+
+        if self._bulk_supported:
+            payload = {"documents": [request.to_dict() for request in create_requests]}
+            try:
+                response = self._make_request("POST", "/documents/bulk", json=payload)
+                return [doc["id"] for doc in self._decode(response)["documents"]]
+            except NotFoundError:
+                self._bulk_supported = False
+            except ServerError as e:
+                if e.status_code != 405:
+                    raise
+                self._bulk_supported = False
+
+        return [self.insert(request) for request in create_requests]
+
+    @staticmethod
+    def _to_create_request(
+        document: Union[DocumentDict, CreateDocumentRequest],
+    ) -> CreateDocumentRequest:
+        """Validate a document dict and convert it to a CreateDocumentRequest."""
+        if isinstance(document, dict):
+            return CreateDocumentRequest.from_dict(document)
+        return document
+
     def update(self, doc_id: str, updates: DocumentDict) -> Document:
         """
         Update an existing document.
@@ -255,16 +514,19 @@ class KotaDB:
         Returns:
             Updated document
         """
+        updates = self._prepare_updates(updates)
+        self._invalidate(doc_id)
+        response = self._make_request("PUT", f"/documents/{doc_id}", json=updates)
+        return Document.from_dict(self._decode(response))
+
+    @staticmethod
+    def _prepare_updates(updates: DocumentDict) -> DocumentDict:
+        """Convert update fields to the wire format expected by the server."""
         # Convert content to byte array if present
         if "content" in updates:
-            content = updates["content"]
-            if isinstance(content, str):
-                updates["content"] = list(content.encode("utf-8"))
-            elif isinstance(content, bytes):
-                updates["content"] = list(content)
+            updates["content"] = content_to_bytes(updates["content"])
 
-        response = self._make_request("PUT", f"/documents/{doc_id}", json=updates)
-        return Document.from_dict(response.json())
+        return updates
 
     def delete(self, doc_id: str) -> bool:
         """
@@ -276,6 +538,7 @@ class KotaDB:
         Returns:
             True if deletion was successful
         """
+        self._invalidate(doc_id)
         self._make_request("DELETE", f"/documents/{doc_id}")
         return True
 
@@ -295,7 +558,7 @@ class KotaDB:
             params["limit"] = limit
 
         response = self._make_request("GET", "/documents", params=params)
-        data = response.json()
+        data = self._decode(response)
         return [Document.from_dict(doc) for doc in data["documents"]]
 
     def health(self) -> Dict[str, Any]:
@@ -306,7 +569,7 @@ class KotaDB:
             Health status information
         """
         response = self._make_request("GET", "/health")
-        return response.json()
+        return self._decode(response)
 
     def stats(self) -> Dict[str, Any]:
         """
@@ -316,7 +579,7 @@ class KotaDB:
             Database statistics
         """
         response = self._make_request("GET", "/stats")
-        return response.json()
+        return self._decode(response)
 
     def __enter__(self):
         """Context manager entry."""
@@ -324,7 +587,7 @@ class KotaDB:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
-        self.session.close()
+        self.close()
 
     def close(self):
         """Close the client session."""
@@ -0,0 +1,73 @@
+"""
+KotaDB wire-format helpers.
+
+JSON uses orjson when it is installed (``pip install kotadb-client[fast]``)
+and falls back to the standard library otherwise. Both paths work on bytes so
+responses are parsed straight from ``response.content`` without an
+intermediate ``str`` decode. MessagePack support requires msgspec
+(``pip install kotadb-client[msgpack]``).
+"""
+
+import json
+import math
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+JSON_CONTENT_TYPE = "application/json"
+
+# Shared across requests; HTTP libraries merge headers without mutating them
+JSON_HEADERS = {"Content-Type": JSON_CONTENT_TYPE}
+
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+MSGPACK_HEADERS = {"Content-Type": MSGPACK_CONTENT_TYPE}
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialize an object to JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    try:
+        text = json.dumps(obj, separators=(",", ":"), ensure_ascii=False, allow_nan=False)
+    except ValueError as e:
+        if "float" not in str(e):
+            raise
+        # orjson writes NaN and infinity as null; match it instead of emitting invalid JSON
+        text = json.dumps(_finite(obj), separators=(",", ":"), ensure_ascii=False)
+    return text.encode("utf-8")
+
+
+def _finite(obj: Any) -> Any:
+    """Copy a JSON-compatible value with non-finite floats replaced by None."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    return obj
+
+
+def json_loads(data: bytes) -> Any:
+    """Deserialize JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def msgpack_dumps(obj: Any) -> bytes:
+    """Serialize an object to MessagePack bytes."""
+    return msgspec.msgpack.encode(obj)
+
+
+def msgpack_loads(data: bytes) -> Any:
+    """Deserialize MessagePack bytes. Raises ValueError on malformed input."""
+    return msgspec.msgpack.decode(data)
@@ -2,12 +2,46 @@
 KotaDB data types and models.
 """
 
+import sys
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Union
 
+from .exceptions import ValidationError
 
-@dataclass
+# Slotted dataclasses (Python 3.10+) use less memory per instance, which adds up
+# for large query results. Older interpreters fall back to regular dataclasses.
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _parse_timestamp(value: Any) -> datetime:
+    """Parse a Unix timestamp or ISO-8601 string, defaulting to now."""
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value)
+    if value is not None:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return datetime.now()
+
+
+def content_to_bytes(content: Union[str, bytes, List[int]]) -> List[int]:
+    """Convert document content to the byte array the server expects."""
+    if isinstance(content, str):
+        return list(content.encode("utf-8"))
+    if isinstance(content, bytes):
+        return list(content)
+    return content
+
+
+def _first_present(data: Dict[str, Any], *keys: str) -> Any:
+    """Return the value of the first key present in data, or None."""
+    for key in keys:
+        value = data.get(key)
+        if value is not None:
+            return value
+    return None
+
+
+@dataclass(**_SLOTS)
 class Document:
     """Represents a document in KotaDB."""
 
@@ -24,6 +58,8 @@ class Document:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Document":
         """Create a Document from a dictionary response."""
+        get = data.get
+
         # Handle content which comes as byte array from server
         content = data["content"]
         if isinstance(content, list):
@@ -31,55 +67,35 @@ class Document:
             content = bytes(content).decode("utf-8", errors="replace")
 
         # Handle timestamp fields - they may be Unix timestamps or ISO strings
-        created_at = data.get("created_at", data.get("created_at_unix"))
-        updated_at = data.get("modified_at", data.get("updated_at", data.get("modified_at_unix")))
-
-        if isinstance(created_at, (int, float)):
-            created_at = datetime.fromtimestamp(created_at)
-        elif created_at is not None:
-            created_at = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-        else:
-            created_at = datetime.now()
-
-        if isinstance(updated_at, (int, float)):
-            updated_at = datetime.fromtimestamp(updated_at)
-        elif updated_at is not None:
-            updated_at = datetime.fromisoformat(updated_at.replace("Z", "+00:00"))
-        else:
-            updated_at = datetime.now()
+        created_at = _first_present(data, "created_at", "created_at_unix")
+        updated_at = _first_present(data, "modified_at", "updated_at", "modified_at_unix")
+        size = get("size_bytes")
 
         return cls(
             id=data["id"],
             path=data["path"],
             title=data["title"],
             content=content,
-            tags=data.get("tags", []),
-            created_at=created_at,
-            updated_at=updated_at,
-            size=data.get("size_bytes", data.get("size", 0)),
-            metadata=data.get("metadata"),
+            tags=get("tags", []),
+            created_at=_parse_timestamp(created_at),
+            updated_at=_parse_timestamp(updated_at),
+            size=get("size", 0) if size is None else size,
+            metadata=get("metadata"),
         )
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert Document to dictionary for API requests."""
-        # Convert content to byte array if it's a string
-        content = self.content
-        if isinstance(content, str):
-            content = list(content.encode("utf-8"))
-        elif isinstance(content, bytes):
-            content = list(content)
-
         return {
             "id": self.id,
             "path": self.path,
             "title": self.title,
-            "content": content,
+            "content": content_to_bytes(self.content),
             "tags": self.tags,
             "metadata": self.metadata,
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SearchResult:
     """Represents a search result with relevance score."""
 
@@ -133,16 +149,37 @@ class CreateDocumentRequest:
     tags: Optional[List[str]] = None
     metadata: Optional[Dict[str, Any]] = None
 
+    def __post_init__(self) -> None:
+        """Validate field types once, when the request is built."""
+        if not isinstance(self.path, str):
+            raise ValidationError("Field 'path' must be a string")
+        if not isinstance(self.title, str):
+            raise ValidationError("Field 'title' must be a string")
+        if not isinstance(self.content, (str, bytes, list)):
+            raise ValidationError("Field 'content' must be a string, bytes or byte array")
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CreateDocumentRequest":
+        """Create a CreateDocumentRequest from a document dictionary."""
+        get = data.get
+        try:
+            return cls(
+                path=data["path"],
+                title=data["title"],
+                content=data["content"],
+                tags=get("tags"),
+                metadata=get("metadata"),
+            )
+        except KeyError as e:
+            raise ValidationError(f"Required field '{e.args[0]}' missing") from None
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for API request."""
-        # Convert content to byte array if it's a string
-        content = self.content
-        if isinstance(content, str):
-            content = list(content.encode("utf-8"))
-        elif isinstance(content, bytes):
-            content = list(content)
-
-        data = {"path": self.path, "title": self.title, "content": content}
+        data = {
+            "path": self.path,
+            "title": self.title,
+            "content": content_to_bytes(self.content),
+        }
         if self.tags:
             data["tags"] = self.tags
         if self.metadata:
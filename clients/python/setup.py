@@ -37,6 +37,21 @@ setup(
         "urllib3>=1.26.0",
     ],
     extras_require={
+        "async": [
+            "aiohttp>=3.8.0",
+        ],
+        "fast": [
+            "orjson>=3.6.0",
+        ],
+        "stream": [
+            "ijson>=3.1.0",
+        ],
+        "compression": [
+            "brotli>=1.0.9",
+        ],
+        "msgpack": [
+            "msgspec>=0.18.0",
+        ],
         "dev": [
             "pytest>=6.0",
             "pytest-cov>=2.0",
@@ -0,0 +1,24 @@
+"""
+Shared pytest fixtures for the KotaDB Python client tests.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from kotadb.client import KotaDB
+
+
+@pytest.fixture(scope="module")
+def db():
+    """
+    One KotaDB client per test module, constructed without a server.
+
+    Tests patch requests.Session.request themselves, so the same client can
+    serve every test. Tests that change client state (document cache, bulk
+    endpoint detection, serializer) should construct their own client.
+    """
+    with patch.object(KotaDB, "_test_connection"):
+        client = KotaDB("http://localhost:8080")
+    yield client
+    client.close()
@@ -0,0 +1,119 @@
+"""
+Tests for the KotaDB async Python client.
+"""
+
+import asyncio
+import subprocess
+import sys
+from contextlib import asynccontextmanager
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web  # noqa: E402
+from aiohttp.test_utils import TestServer  # noqa: E402
+
+from kotadb.async_client import AsyncKotaDB  # noqa: E402
+from kotadb.exceptions import ConnectionError, NotFoundError, ServerError  # noqa: E402
+from kotadb.types import Document, QueryResult  # noqa: E402
+
+
+def _document(doc_id: str) -> dict:
+    return {
+        "id": doc_id,
+        "path": f"/{doc_id}.md",
+        "title": f"Doc {doc_id}",
+        "content": list(b"Test content"),  # Byte array
+        "tags": ["test"],
+        "created_at_unix": 1704067200,  # Unix timestamp
+        "modified_at_unix": 1704067200,  # Unix timestamp
+        "size_bytes": 100,
+    }
+
+
+async def _get_document(request: web.Request) -> web.Response:
+    doc_id = request.match_info["doc_id"]
+    if doc_id == "missing":
+        return web.json_response({"error": "not_found"}, status=404)
+    if doc_id == "broken":
+        return web.json_response({"error": "Internal server error"}, status=500)
+    return web.json_response(_document(doc_id))
+
+
+async def _search(request: web.Request) -> web.Response:
+    return web.json_response({"documents": [_document(request.query["q"])], "total_count": 1})
+
+
+async def _create(request: web.Request) -> web.Response:
+    body = await request.json()
+    return web.json_response({"id": body["path"].strip("/")}, status=201)
+
+
+@asynccontextmanager
+async def _serve():
+    app = web.Application()
+    app.router.add_get("/documents/search", _search)
+    app.router.add_get("/documents/{doc_id}", _get_document)
+    app.router.add_post("/documents", _create)
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        yield str(server.make_url(""))
+    finally:
+        await server.close()
+
+
+class TestAsyncKotaDB:
+    """Test suite for the async KotaDB client."""
+
+    def test_parse_url_kotadb_scheme(self):
+        """Test URL parsing matches the sync client."""
+        db = AsyncKotaDB("kotadb://localhost:8080/myapp")
+        assert db.base_url == "http://localhost:8080"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_gets(self):
+        """Test gathering several document retrievals."""
+        async with _serve() as url, AsyncKotaDB(url) as db:
+            docs = await asyncio.gather(*(db.get(doc_id) for doc_id in ["a", "b", "c"]))
+
+        assert [doc.id for doc in docs] == ["a", "b", "c"]
+        assert all(isinstance(doc, Document) for doc in docs)
+        assert docs[0].content == "Test content"
+
+    @pytest.mark.asyncio
+    async def test_query_and_insert(self):
+        """Test query and insert share one session."""
+        async with _serve() as url, AsyncKotaDB(url) as db:
+            result = await db.query("rust", limit=3)
+            doc_id = await db.insert({"path": "/new", "title": "New", "content": "x"})
+
+        assert isinstance(result, QueryResult)
+        assert result.results[0].id == "rust"
+        assert doc_id == "new"
+
+    @pytest.mark.asyncio
+    async def test_error_mapping(self):
+        """Test HTTP errors map to the client exception types."""
+        async with _serve() as url, AsyncKotaDB(url) as db:
+            with pytest.raises(NotFoundError):
+                await db.get("missing")
+            with pytest.raises(ServerError, match="Internal server error"):
+                await db.get("broken")
+
+    @pytest.mark.asyncio
+    async def test_connection_failure(self):
+        """Test connection errors surface as ConnectionError."""
+        async with AsyncKotaDB("http://127.0.0.1:1", timeout=2) as db:
+            with pytest.raises(ConnectionError, match="Request failed"):
+                await db.health()
+
+
+def test_package_import_does_not_load_aiohttp():
+    """Test importing kotadb defers aiohttp until AsyncKotaDB is accessed."""
+    code = (
+        "import sys, kotadb\n"
+        "assert 'aiohttp' not in sys.modules\n"
+        "assert kotadb.AsyncKotaDB is sys.modules['kotadb.async_client'].AsyncKotaDB\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
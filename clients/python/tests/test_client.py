@@ -2,8 +2,12 @@
 Tests for KotaDB Python client.
 """
 
+import io
+import itertools
+import json
 from datetime import datetime
-from unittest.mock import Mock, patch
+from typing import Any, Dict, Optional
+from unittest.mock import patch
 
 import pytest
 import requests
@@ -18,6 +22,30 @@ from kotadb.exceptions import (
 from kotadb.types import CreateDocumentRequest, Document, QueryResult
 
 
+class _FakeResponse:
+    """Lightweight stand-in for requests.Response without Mock's call-recording overhead."""
+
+    def __init__(
+        self,
+        status_code: int,
+        payload: Any = None,
+        *,
+        content: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        self.status_code = status_code
+        if content is None:
+            content = b"" if payload is None else json.dumps(payload).encode()
+        self.content = content
+        self.text = content.decode("utf-8", errors="replace")
+        self.headers = {"Content-Type": "application/json"} if headers is None else headers
+        self.raw = io.BytesIO(content)
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
 class TestKotaDBClient:
     """Test suite for KotaDB client."""
 
@@ -55,8 +83,7 @@ class TestKotaDBClient:
     @patch("requests.Session.get")
     def test_test_connection_success(self, mock_get):
         """Test successful connection test."""
-        mock_response = Mock()
-        mock_response.status_code = 200
+        mock_response = _FakeResponse(200)
         mock_get.return_value = mock_response
 
         # Should not raise exception
@@ -71,30 +98,76 @@ class TestKotaDBClient:
         with pytest.raises(ConnectionError, match="Failed to connect"):
             KotaDB("http://localhost:8080")
 
+    @patch("requests.Session.request")
+    @patch("requests.Session.get")
+    def test_skip_connection_probe(self, mock_get, mock_request):
+        """Test verify_on_connect=False defers connection errors to the first call."""
+        mock_request.side_effect = requests.RequestException("Connection refused")
+
+        db = KotaDB("http://localhost:8080", verify_on_connect=False)
+        mock_get.assert_not_called()
+
+        with pytest.raises(ConnectionError, match="Request failed"):
+            db.stats()
+
+    @patch("requests.Session.request")
+    def test_warmup(self, mock_request, db):
+        """Test warmup issues one health check per requested connection."""
+        mock_request.return_value = _FakeResponse(200, {"status": "healthy"})
+
+        db.warmup()
+        assert mock_request.call_count == 1
+
+        db.warmup(connections=4)
+        assert mock_request.call_count == 5
+        assert all(
+            call[0] == ("GET", "http://localhost:8080/health")
+            for call in mock_request.call_args_list
+        )
+
     @patch("kotadb.client.KotaDB._test_connection")
     @patch("requests.Session.request")
-    def test_query_success(self, mock_request, mock_test):
+    def test_warmup_capped_at_pool_size(self, mock_request, mock_test):
+        """Test warmup never opens more connections than the pool keeps."""
+        mock_request.return_value = _FakeResponse(200, {"status": "healthy"})
+
+        db = KotaDB("http://localhost:8080", pool_maxsize=2)
+        db.warmup(connections=8)
+
+        assert mock_request.call_count == 2
+
+    @patch("requests.Session.request")
+    def test_request_timeouts(self, mock_request, db):
+        """Test every request carries the (connect, read) timeout pair."""
+        mock_request.return_value = _FakeResponse(200, {"document_count": 0})
+
+        db.stats()
+
+        assert mock_request.call_args[1]["timeout"] == (3.05, 30)
+
+    @patch("requests.Session.request")
+    def test_query_success(self, mock_request, db):
         """Test successful query operation."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "documents": [
-                {
-                    "id": "doc1",
-                    "path": "/test.md",
-                    "title": "Test Doc",
-                    "content": list(b"Test content"),  # Byte array
-                    "tags": ["test"],
-                    "created_at_unix": 1704067200,  # Unix timestamp
-                    "modified_at_unix": 1704067200,  # Unix timestamp
-                    "size_bytes": 100,
-                }
-            ],
-            "total_count": 1,
-        }
+        mock_response = _FakeResponse(
+            200,
+            {
+                "documents": [
+                    {
+                        "id": "doc1",
+                        "path": "/test.md",
+                        "title": "Test Doc",
+                        "content": list(b"Test content"),  # Byte array
+                        "tags": ["test"],
+                        "created_at_unix": 1704067200,  # Unix timestamp
+                        "modified_at_unix": 1704067200,  # Unix timestamp
+                        "size_bytes": 100,
+                    }
+                ],
+                "total_count": 1,
+            },
+        )
         mock_request.return_value = mock_response
 
-        db = KotaDB("http://localhost:8080")
         result = db.query("test query")
 
         assert isinstance(result, QueryResult)
@@ -103,25 +176,75 @@ class TestKotaDBClient:
         assert result.results[0].title == "Test Doc"
         assert result.results[0].content == "Test content"
 
-    @patch("kotadb.client.KotaDB._test_connection")
+    @staticmethod
+    def _search_response(key: str) -> _FakeResponse:
+        body = {
+            key: [
+                {"id": f"doc{i}", "path": f"/{i}.md", "title": f"Doc {i}", "content": []}
+                for i in range(3)
+            ],
+            "total_count": 3,
+        }
+        return _FakeResponse(200, body)
+
+    @pytest.mark.parametrize("key", ["documents", "results"])
+    @patch("requests.Session.request")
+    def test_query_iter(self, mock_request, db, key):
+        """Test query_iter without ijson parses the full body and yields documents."""
+        mock_response = self._search_response(key)
+        mock_request.return_value = mock_response
+
+        with patch("kotadb.client.ijson", None):
+            docs = list(db.query_iter("test", limit=3))
+
+        assert [doc.id for doc in docs] == ["doc0", "doc1", "doc2"]
+        assert mock_request.call_args[1]["stream"] is True
+        assert mock_request.call_args[1]["params"] == {"q": "test", "limit": 3}
+        assert mock_response.closed
+
+    @pytest.mark.parametrize("key", ["documents", "results"])
     @patch("requests.Session.request")
-    def test_get_document_success(self, mock_request, mock_test):
+    def test_query_iter_streaming(self, mock_request, db, key):
+        """Test query_iter with ijson streams the body and closes the response early."""
+        pytest.importorskip("ijson")
+        mock_response = self._search_response(key)
+        mock_request.return_value = mock_response
+
+        docs = list(itertools.islice(db.query_iter("test"), 2))
+
+        assert [doc.id for doc in docs] == ["doc0", "doc1"]
+        # Only the streaming path reads response.raw, asking urllib3 to decompress it
+        assert mock_response.raw.decode_content is True
+        assert mock_response.closed
+
+    @patch("requests.Session.request")
+    def test_query_iter_raises_on_iteration(self, mock_request, db):
+        """Test errors surface when iteration starts, not when query_iter is called."""
+        mock_request.return_value = _FakeResponse(500, {"error": "boom"})
+
+        results = db.query_iter("test")
+        mock_request.assert_not_called()
+        with pytest.raises(ServerError, match="boom"):
+            next(results)
+
+    @patch("requests.Session.request")
+    def test_get_document_success(self, mock_request, db):
         """Test successful document retrieval."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "id": "doc1",
-            "path": "/test.md",
-            "title": "Test Doc",
-            "content": list(b"Test content"),  # Byte array
-            "tags": ["test"],
-            "created_at_unix": 1704067200,  # Unix timestamp
-            "modified_at_unix": 1704067200,  # Unix timestamp
-            "size_bytes": 100,
-        }
+        mock_response = _FakeResponse(
+            200,
+            {
+                "id": "doc1",
+                "path": "/test.md",
+                "title": "Test Doc",
+                "content": list(b"Test content"),  # Byte array
+                "tags": ["test"],
+                "created_at_unix": 1704067200,  # Unix timestamp
+                "modified_at_unix": 1704067200,  # Unix timestamp
+                "size_bytes": 100,
+            },
+        )
         mock_request.return_value = mock_response
 
-        db = KotaDB("http://localhost:8080")
         doc = db.get("doc1")
 
         assert isinstance(doc, Document)
@@ -131,36 +254,88 @@ class TestKotaDBClient:
 
     @patch("kotadb.client.KotaDB._test_connection")
     @patch("requests.Session.request")
-    def test_get_document_not_found(self, mock_request, mock_test):
-        """Test document not found error."""
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_request.return_value = mock_response
+    def test_get_document_cached_by_etag(self, mock_request, mock_test):
+        """Test repeat reads revalidate with If-None-Match and reuse cached documents."""
+        fresh = _FakeResponse(
+            200,
+            {
+                "id": "doc1",
+                "path": "/test.md",
+                "title": "Test Doc",
+                "content": list(b"Test content"),
+                "tags": ["test"],
+                "size_bytes": 100,
+            },
+            headers={"ETag": '"v1"'},
+        )
+        not_modified = _FakeResponse(304, headers={"ETag": '"v1"'})
+        mock_request.side_effect = [fresh, not_modified, _FakeResponse(200), fresh]
 
         db = KotaDB("http://localhost:8080")
+        first = db.get("doc1")
+        first.tags.append("local-edit")
+        second = db.get("doc1")
+
+        # A 304 returns a fresh copy that is unaffected by edits to earlier results
+        assert second is not first
+        assert second.tags == ["test"]
+        assert second.title == first.title
+        assert mock_request.call_args_list[0][1]["headers"] is None
+        assert mock_request.call_args_list[1][1]["headers"] == {"If-None-Match": '"v1"'}
+
+        # Deleting drops the cached copy so the next read is unconditional
+        db.delete("doc1")
+        db.get("doc1")
+        assert mock_request.call_args_list[3][1]["headers"] is None
+
+        # Documents with explicit null tags are cached and copied too
+        untagged = _FakeResponse(
+            200,
+            {"id": "doc2", "path": "/a.md", "title": "a", "content": [], "tags": None},
+            headers={"ETag": '"v2"'},
+        )
+        mock_request.side_effect = [untagged, not_modified]
+        assert db.get("doc2").tags is None
+        assert db.get("doc2").tags is None
+        assert mock_request.call_args_list[5][1]["headers"] == {"If-None-Match": '"v2"'}
+
+    @patch("kotadb.client.KotaDB._test_connection")
+    def test_get_document_cache_eviction(self, mock_test):
+        """Test the document cache is bounded by cache_size."""
+        db = KotaDB("http://localhost:8080", cache_size=2)
+
+        with patch("requests.Session.request") as mock_request:
+            for doc_id in ["a", "b", "c"]:
+                mock_request.return_value = _FakeResponse(
+                    200,
+                    {"id": doc_id, "path": f"/{doc_id}.md", "title": doc_id, "content": []},
+                    headers={"ETag": f'"{doc_id}"'},
+                )
+                db.get(doc_id)
+
+        assert list(db._doc_cache) == ["b", "c"]
+
+    @patch("requests.Session.request")
+    def test_get_document_not_found(self, mock_request, db):
+        """Test document not found error."""
+        mock_response = _FakeResponse(404)
+        mock_request.return_value = mock_response
 
         with pytest.raises(NotFoundError):
             db.get("nonexistent")
 
-    @patch("kotadb.client.KotaDB._test_connection")
     @patch("requests.Session.request")
-    def test_insert_document_dict(self, mock_request, mock_test):
+    def test_insert_document_dict(self, mock_request, db):
         """Test document insertion with dictionary."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"id": "new_doc_id"}
+        mock_response = _FakeResponse(200, {"id": "new_doc_id"})
         mock_request.return_value = mock_response
 
-        db = KotaDB("http://localhost:8080")
         doc_id = db.insert({"path": "/new.md", "title": "New Doc", "content": "New content"})
 
         assert doc_id == "new_doc_id"
 
-    @patch("kotadb.client.KotaDB._test_connection")
-    def test_insert_document_missing_fields(self, mock_test):
+    def test_insert_document_missing_fields(self, db):
         """Test document insertion with missing required fields."""
-        db = KotaDB("http://localhost:8080")
-
         with pytest.raises(ValidationError, match="Required field 'title' missing"):
             db.insert(
                 {
@@ -170,16 +345,12 @@ class TestKotaDBClient:
                 }
             )
 
-    @patch("kotadb.client.KotaDB._test_connection")
     @patch("requests.Session.request")
-    def test_insert_document_request_object(self, mock_request, mock_test):
+    def test_insert_document_request_object(self, mock_request, db):
         """Test document insertion with CreateDocumentRequest object."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"id": "new_doc_id"}
+        mock_response = _FakeResponse(200, {"id": "new_doc_id"})
         mock_request.return_value = mock_response
 
-        db = KotaDB("http://localhost:8080")
         request = CreateDocumentRequest(
             path="/new.md", title="New Doc", content="New content", tags=["test"]
         )
@@ -187,42 +358,119 @@ class TestKotaDBClient:
 
         assert doc_id == "new_doc_id"
 
+    @patch("requests.Session.request")
+    def test_insert_bulk(self, mock_request, db):
+        """Test bulk insertion sends all documents in one request."""
+        mock_response = _FakeResponse(200, {"documents": [{"id": "doc1"}, {"id": "doc2"}]})
+        mock_request.return_value = mock_response
+
+        doc_ids = db.insert_bulk(
+            [
+                {"path": "/a.md", "title": "A", "content": "a"},
+                CreateDocumentRequest(path="/b.md", title="B", content="b"),
+            ]
+        )
+
+        assert doc_ids == ["doc1", "doc2"]
+        mock_request.assert_called_once()
+        args, kwargs = mock_request.call_args
+        assert args == ("POST", "http://localhost:8080/documents/bulk")
+        assert kwargs["headers"] == {"Content-Type": "application/json"}
+        body = json.loads(kwargs["data"])
+        assert [doc["path"] for doc in body["documents"]] == ["/a.md", "/b.md"]
+
+    @patch("kotadb.client.KotaDB._test_connection")
+    @patch("requests.Session.request")
+    def test_insert_bulk_fallback(self, mock_request, mock_test):
+        """Test bulk insertion falls back to single inserts without a bulk endpoint."""
+        not_found = _FakeResponse(404)
+        created = [_FakeResponse(200, {"id": "doc1"}), _FakeResponse(200, {"id": "doc2"})]
+        mock_request.side_effect = [not_found, *created]
+
+        db = KotaDB("http://localhost:8080")
+        doc_ids = db.insert_bulk(
+            [
+                {"path": "/a.md", "title": "A", "content": "a"},
+                {"path": "/b.md", "title": "B", "content": "b"},
+            ]
+        )
+
+        assert doc_ids == ["doc1", "doc2"]
+        assert mock_request.call_count == 3
+        assert db.bulk_supported is False
+
+    def test_insert_bulk_missing_fields(self, db):
+        """Test bulk insertion validates every document before sending."""
+        with pytest.raises(ValidationError, match="Required field 'content' missing"):
+            db.insert_bulk([{"path": "/a.md", "title": "A"}])
+
     @patch("kotadb.client.KotaDB._test_connection")
     @patch("requests.Session.request")
-    def test_delete_document_success(self, mock_request, mock_test):
+    def test_msgpack_serializer(self, mock_request, mock_test):
+        """Test MessagePack bodies and responses, falling back to JSON on 415."""
+        msgspec = pytest.importorskip("msgspec")
+
+        created = _FakeResponse(
+            200,
+            content=msgspec.msgpack.encode({"id": "doc1"}),
+            headers={"Content-Type": "application/msgpack"},
+        )
+        unsupported = _FakeResponse(415)
+        json_created = _FakeResponse(200, {"id": "doc2"})
+        mock_request.side_effect = [created, unsupported, json_created]
+
+        db = KotaDB("http://localhost:8080", serializer="msgpack")
+        assert db.session.headers["Accept"].startswith("application/msgpack")
+
+        assert db.insert({"path": "/a.md", "title": "A", "content": "a"}) == "doc1"
+        kwargs = mock_request.call_args_list[0][1]
+        assert kwargs["headers"] == {"Content-Type": "application/msgpack"}
+        assert msgspec.msgpack.decode(kwargs["data"])["path"] == "/a.md"
+
+        # A server without MessagePack support gets the same body as JSON
+        assert db.insert({"path": "/b.md", "title": "B", "content": "b"}) == "doc2"
+        kwargs = mock_request.call_args_list[2][1]
+        assert kwargs["headers"] == {"Content-Type": "application/json"}
+        assert json.loads(kwargs["data"])["path"] == "/b.md"
+
+    @patch("kotadb.client.KotaDB._test_connection")
+    def test_unsupported_serializer(self, mock_test):
+        """Test unknown serializers are rejected."""
+        with pytest.raises(ValidationError, match="Unsupported serializer"):
+            KotaDB("http://localhost:8080", serializer="xml")
+
+    @patch("requests.Session.request")
+    def test_unserializable_body(self, mock_request, db):
+        """Test bodies the serializer rejects raise ValidationError before sending."""
+        with pytest.raises(ValidationError, match="not serializable"):
+            db.insert({"path": "/a.md", "title": "A", "content": "a", "metadata": {"x": object()}})
+
+        mock_request.assert_not_called()
+
+    @patch("requests.Session.request")
+    def test_delete_document_success(self, mock_request, db):
         """Test successful document deletion."""
-        mock_response = Mock()
-        mock_response.status_code = 200
+        mock_response = _FakeResponse(200)
         mock_request.return_value = mock_response
 
-        db = KotaDB("http://localhost:8080")
         result = db.delete("doc1")
 
         assert result is True
 
-    @patch("kotadb.client.KotaDB._test_connection")
     @patch("requests.Session.request")
-    def test_server_error(self, mock_request, mock_test):
+    def test_server_error(self, mock_request, db):
         """Test server error handling."""
-        mock_response = Mock()
-        mock_response.status_code = 500
-        mock_response.json.return_value = {"error": "Internal server error"}
-        mock_response.text = "Internal server error"
+        mock_response = _FakeResponse(500, {"error": "Internal server error"})
         mock_request.return_value = mock_response
 
-        db = KotaDB("http://localhost:8080")
-
         with pytest.raises(ServerError, match="Internal server error"):
             db.get("doc1")
 
-    @patch("kotadb.client.KotaDB._test_connection")
     @patch("requests.Session.request")
-    def test_request_exception(self, mock_request, mock_test):
+    def test_request_exception(self, mock_request, db):
         """Test request exception handling."""
         mock_request.side_effect = requests.RequestException("Network error")
 
-        db = KotaDB("http://localhost:8080")
-
         with pytest.raises(ConnectionError, match="Request failed"):
             db.get("doc1")
 
@@ -234,6 +482,25 @@ class TestKotaDBClient:
             # The session.close() is called in __exit__
             assert hasattr(db, "session")
 
+    @patch("kotadb.client.KotaDB._test_connection")
+    def test_session_connection_pool(self, mock_test):
+        """Test that one pooled session is shared and closed with the client."""
+        db = KotaDB("http://localhost:8080", pool_connections=4, pool_maxsize=8)
+        adapter = db.session.get_adapter("http://localhost:8080")
+
+        assert adapter is db.session.get_adapter("https://localhost:8080")
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 8
+        assert adapter.max_retries.total == 3
+        assert adapter.max_retries.backoff_factor == 0.5
+        assert 503 in adapter.max_retries.status_forcelist
+        assert db.session.headers["Accept"] == "application/json"
+
+        with patch.object(db.session, "close") as mock_close:
+            with db:
+                pass
+            mock_close.assert_called_once()
+
 
 class TestDocumentType:
     """Test Document data type."""
@@ -318,3 +585,23 @@ class TestCreateDocumentRequest:
             "tags": ["test"],
             "metadata": {"author": "test"},
         }
+
+    def test_from_dict(self):
+        """Test CreateDocumentRequest creation from a dictionary."""
+        request = CreateDocumentRequest.from_dict(
+            {"path": "/test.md", "title": "Test", "content": "Content", "tags": ["test"]}
+        )
+
+        assert request == CreateDocumentRequest(
+            path="/test.md", title="Test", content="Content", tags=["test"]
+        )
+
+    def test_from_dict_missing_field(self):
+        """Test missing required fields are reported by name."""
+        with pytest.raises(ValidationError, match="Required field 'content' missing"):
+            CreateDocumentRequest.from_dict({"path": "/test.md", "title": "Test"})
+
+    def test_invalid_field_type(self):
+        """Test field types are validated at construction."""
+        with pytest.raises(ValidationError, match="Field 'title' must be a string"):
+            CreateDocumentRequest(path="/test.md", title=None, content="Content")
@@ -4,6 +4,7 @@ Property-based tests for KotaDB Python client using Hypothesis.
 These tests ensure the client behaves correctly across a wide range of inputs.
 """
 
+import json
 import string
 from datetime import datetime
 from typing import Any, Dict, List
@@ -183,7 +184,7 @@ class TestQueryParameters:
 
             with patch.object(client, "_make_request") as mock_request:
                 mock_response = Mock()
-                mock_response.json.return_value = {"documents": [], "total_count": 0}
+                mock_response.content = json.dumps({"documents": [], "total_count": 0}).encode()
                 mock_request.return_value = mock_response
 
                 # Should not raise an exception
@@ -232,7 +233,7 @@ class TestQueryParameters:
 
         with patch.object(self.client, "_make_request") as mock:
             mock_response = Mock()
-            mock_response.json.return_value = {"id": doc_id}
+            mock_response.content = json.dumps({"id": doc_id}).encode()
             mock.return_value = mock_response
 
             result_id = self.client.insert(
@@ -259,16 +260,18 @@ class TestQueryParameters:
 
             with patch.object(self.client, "_make_request") as mock:
                 mock_response = Mock()
-                mock_response.json.return_value = {
-                    "id": doc_id,
-                    "path": doc_data["path"],
-                    "title": doc_data["title"],
-                    "content": list(doc_data["content"].encode("utf-8")),
-                    "tags": doc_data["tags"],
-                    "created_at_unix": 1704067200,
-                    "modified_at_unix": 1704067200,
-                    "size_bytes": len(doc_data["content"]),
-                }
+                mock_response.content = json.dumps(
+                    {
+                        "id": doc_id,
+                        "path": doc_data["path"],
+                        "title": doc_data["title"],
+                        "content": list(doc_data["content"].encode("utf-8")),
+                        "tags": doc_data["tags"],
+                        "created_at_unix": 1704067200,
+                        "modified_at_unix": 1704067200,
+                        "size_bytes": len(doc_data["content"]),
+                    }
+                ).encode()
                 mock.return_value = mock_response
 
                 doc = self.client.get(doc_id)
@@ -0,0 +1,82 @@
+"""
+Tests for KotaDB wire-format helpers.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from kotadb import serialization
+from kotadb.serialization import json_dumps, json_loads, msgpack_dumps, msgpack_loads
+
+PAYLOAD = {"title": "Test Doc", "content": list(b"Test content"), "tags": ["test"]}
+
+
+class TestJsonSerialization:
+    """Test JSON encoding and decoding."""
+
+    def test_round_trip(self):
+        """Test encoding produces bytes that decode to the same value."""
+        data = json_dumps(PAYLOAD)
+
+        assert isinstance(data, bytes)
+        assert json_loads(data) == PAYLOAD
+
+    def test_stdlib_fallback(self):
+        """Test the stdlib path is used when orjson is not installed."""
+        with patch.object(serialization, "orjson", None):
+            data = json_dumps(PAYLOAD)
+
+            assert (
+                data
+                == b'{"title":"Test Doc","content":[84,101,115,116,32,99,111,110,116,101,110,116],"tags":["test"]}'
+            )
+            assert json_loads(data) == PAYLOAD
+
+    def test_non_ascii_matches_orjson(self):
+        """Test both paths emit the same compact UTF-8 encoding."""
+        payload = {"title": "Café notes ✓"}
+        fast = json_dumps(payload)
+        with patch.object(serialization, "orjson", None):
+            fallback = json_dumps(payload)
+
+        assert fallback == '{"title":"Café notes ✓"}'.encode()
+        assert fast == fallback
+
+    def test_non_finite_floats_match_orjson(self):
+        """Test NaN and infinity are written as null rather than invalid JSON."""
+        payload = {"metadata": {"score": float("nan"), "bounds": [1.5, float("inf")]}}
+        fast = json_dumps(payload)
+        with patch.object(serialization, "orjson", None):
+            fallback = json_dumps(payload)
+
+        assert fallback == b'{"metadata":{"score":null,"bounds":[1.5,null]}}'
+        assert fast == fallback
+
+    def test_invalid_json(self):
+        """Test malformed input raises ValueError on both paths."""
+        with pytest.raises(ValueError):
+            json_loads(b"{not json")
+        with patch.object(serialization, "orjson", None), pytest.raises(ValueError):
+            json_loads(b"{not json")
+
+
+class TestMsgpackSerialization:
+    """Test MessagePack encoding and decoding."""
+
+    def test_round_trip(self):
+        """Test MessagePack encoding round-trips."""
+        pytest.importorskip("msgspec")
+
+        data = msgpack_dumps(PAYLOAD)
+
+        assert isinstance(data, bytes)
+        assert len(data) < len(json_dumps(PAYLOAD))
+        assert msgpack_loads(data) == PAYLOAD
+
+    def test_invalid_msgpack(self):
+        """Test malformed input raises ValueError."""
+        pytest.importorskip("msgspec")
+
+        with pytest.raises(ValueError):
+            msgpack_loads(b"\xc1")
@@ -5,9 +5,12 @@ Demonstrates all core features with real operations.
 """
 
 import os
+import statistics
 import time
 import json
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 
 try:
     from kotadb import KotaDB, DocumentBuilder, QueryBuilder, ValidatedPath
@@ -15,6 +18,101 @@ except ImportError:
     print("❌ kotadb-client not found. Install with: pip install kotadb-client")
     exit(1)
 
+# Sample document bodies, defined once at import time
+RUST_OWNERSHIP_CONTENT = """# Rust Ownership
+        
+Rust's ownership system ensures memory safety without garbage collection.
+
+## Key Concepts:
+- Each value has an owner
+- Only one owner at a time  
+- When owner goes out of scope, value is dropped
+
+## Examples:
+```rust
+let s = String::from("hello");  // s owns the string
+let s2 = s;                     // ownership moves to s2
+// println!("{}", s);           // Error! s no longer valid
+```
+"""
+
+STANDUP_CONTENT = """# Daily Standup - August 14, 2024
+
+## Attendees
+- Alice (PM)
+- Bob (Backend) 
+- Carol (Frontend)
+
+## Updates
+- **Alice**: Working on sprint planning
+- **Bob**: Implementing KotaDB integration
+- **Carol**: Building UI components
+
+## Blockers
+- Waiting for database schema review
+
+## Action Items
+- [ ] Bob: Finish KotaDB demo by Friday
+- [ ] Carol: Update component library
+"""
+
+LEARNING_NOTES_CONTENT = """# Database Learning Notes
+
+## KotaDB Features
+- Custom storage engine
+- Multiple index types (B+tree, trigram, vector)
+- ACID compliance with WAL
+- Zero external dependencies
+
+## Performance
+- Sub-10ms query latency
+- 3,600+ operations per second
+- Efficient memory usage
+
+## Use Cases
+- Personal knowledge bases
+- Document management
+- Search applications
+- AI-powered systems
+"""
+
+SEARCH_ITERATIONS = 20
+
+# Concurrent requests share the client's connection pool (pool_maxsize >= MAX_WORKERS)
+MAX_WORKERS = 4
+
+@contextmanager
+def timed(samples: Optional[List[int]] = None) -> Iterator[List[int]]:
+    """Append the elapsed wall time of the block, in nanoseconds, to samples."""
+    samples = [] if samples is None else samples
+    start = time.perf_counter_ns()
+    try:
+        yield samples
+    finally:
+        samples.append(time.perf_counter_ns() - start)
+
+def latency_percentiles(samples: List[int]) -> Tuple[float, float, float]:
+    """Return p50/p95/p99 of nanosecond samples, in milliseconds."""
+    cuts = statistics.quantiles(samples, n=100)
+    return cuts[49] / 1e6, cuts[94] / 1e6, cuts[98] / 1e6
+
+def fetch_documents(db: KotaDB, doc_ids: List[str]) -> List[Any]:
+    """Retrieve documents concurrently; failures are returned in place."""
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        return list(executor.map(lambda doc_id: call_safely(db.get, doc_id), doc_ids))
+
+def run_searches(db: KotaDB, queries: List[str]) -> List[Any]:
+    """Run independent searches concurrently; failures are returned in place."""
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        return list(executor.map(lambda query: call_safely(db.query, query, limit=3), queries))
+
+def call_safely(func, *args, **kwargs) -> Any:
+    """Call func, returning any exception instead of raising it."""
+    try:
+        return func(*args, **kwargs)
+    except Exception as e:
+        return e
+
 def main():
     print("🚀 KotaDB Python Demo - All Core Features")
     print("=" * 50)
@@ -23,7 +121,8 @@ def main():
     kotadb_url = os.getenv("KOTADB_URL", "http://localhost:8080")
     print(f"📡 Connecting to KotaDB at {kotadb_url}")
     
-    db = KotaDB(kotadb_url)
+    # Skip the separate health probe - the stats call below verifies the connection
+    db = KotaDB(kotadb_url, verify_on_connect=False)
     
     # Test connection
     try:
@@ -31,6 +130,7 @@ def main():
         print(f"✅ Connected! Database has {stats.get('document_count', 0)} documents")
     except Exception as e:
         print(f"❌ Connection failed: {e}")
+        db.close()
         return
     
     print("\n1️⃣ DOCUMENT CREATION (Builder Pattern)")
@@ -44,22 +144,7 @@ def main():
         DocumentBuilder()
         .path(ValidatedPath("/guides/rust-ownership.md"))
         .title("Rust Ownership Guide")
-        .content("""# Rust Ownership
-        
-Rust's ownership system ensures memory safety without garbage collection.
-
-## Key Concepts:
-- Each value has an owner
-- Only one owner at a time  
-- When owner goes out of scope, value is dropped
-
-## Examples:
-```rust
-let s = String::from("hello");  // s owns the string
-let s2 = s;                     // ownership moves to s2
-// println!("{}", s);           // Error! s no longer valid
-```
-""")
+        .content(RUST_OWNERSHIP_CONTENT)
         .add_tag("rust")
         .add_tag("programming")
         .add_tag("tutorial")
@@ -71,25 +156,7 @@ let s2 = s;                     // ownership moves to s2
         DocumentBuilder()
         .path(ValidatedPath("/meetings/2024-08-14-standup.md"))
         .title("Team Standup - Aug 14")
-        .content("""# Daily Standup - August 14, 2024
-
-## Attendees
-- Alice (PM)
-- Bob (Backend) 
-- Carol (Frontend)
-
-## Updates
-- **Alice**: Working on sprint planning
-- **Bob**: Implementing KotaDB integration
-- **Carol**: Building UI components
-
-## Blockers
-- Waiting for database schema review
-
-## Action Items
-- [ ] Bob: Finish KotaDB demo by Friday
-- [ ] Carol: Update component library
-""")
+        .content(STANDUP_CONTENT)
         .add_tag("meeting")
         .add_tag("standup")
         .add_tag("team")
@@ -101,25 +168,7 @@ let s2 = s;                     // ownership moves to s2
         DocumentBuilder()
         .path(ValidatedPath("/personal/learning-notes.md"))
         .title("Database Learning Notes")
-        .content("""# Database Learning Notes
-
-## KotaDB Features
-- Custom storage engine
-- Multiple index types (B+tree, trigram, vector)
-- ACID compliance with WAL
-- Zero external dependencies
-
-## Performance
-- Sub-10ms query latency
-- 3,600+ operations per second
-- Efficient memory usage
-
-## Use Cases
-- Personal knowledge bases
-- Document management
-- Search applications
-- AI-powered systems
-""")
+        .content(LEARNING_NOTES_CONTENT)
         .add_tag("database")
         .add_tag("learning")
         .add_tag("personal")
@@ -131,13 +180,13 @@ let s2 = s;                     // ownership moves to s2
     print("\n2️⃣ DOCUMENT RETRIEVAL")
     print("-" * 40)
     
-    # Get documents back
-    for i, doc_id in enumerate(sample_docs, 1):
-        try:
-            doc = db.get(doc_id)
-            print(f"📄 Doc {i}: '{doc['title']}' - {len(doc['content'])} chars")
-        except Exception as e:
-            print(f"❌ Failed to retrieve doc {i}: {e}")
+    # Get documents back - all retrievals are in flight at once
+    retrieved_docs = fetch_documents(db, sample_docs)
+    for i, doc in enumerate(retrieved_docs, 1):
+        if isinstance(doc, Exception):
+            print(f"❌ Failed to retrieve doc {i}: {doc}")
+        else:
+            print(f"📄 Doc {i}: '{doc.title}' - {len(doc.content)} chars")
     
     print("\n3️⃣ FULL-TEXT SEARCH")
     print("-" * 40)
@@ -150,15 +199,16 @@ let s2 = s;                     // ownership moves to s2
         "ownership"
     ]
     
-    for query in search_queries:
-        try:
-            results = db.query(query, limit=3)
-            print(f"🔍 '{query}': {len(results.get('documents', []))} results")
-            
-            for doc in results.get('documents', [])[:2]:  # Show first 2
-                print(f"   - {doc.get('title', 'No title')}")
-        except Exception as e:
-            print(f"❌ Search '{query}' failed: {e}")
+    # Searches are independent, so run them concurrently
+    search_results = run_searches(db, search_queries)
+    for query, results in zip(search_queries, search_results):
+        if isinstance(results, Exception):
+            print(f"❌ Search '{query}' failed: {results}")
+            continue
+
+        print(f"🔍 '{query}': {len(results.results)} results")
+        for doc in results.results[:2]:  # Show first 2
+            print(f"   - {doc.title}")
     
     print("\n4️⃣ STRUCTURED QUERIES (Builder Pattern)")
     print("-" * 40)
@@ -201,30 +251,40 @@ let s2 = s;                     // ownership moves to s2
     print("\n6️⃣ PERFORMANCE TEST")
     print("-" * 40)
     
-    # Quick performance test
-    start_time = time.time()
-    perf_docs = []
-    
-    for i in range(10):
-        doc_id = db.insert({
-            "path": f"/perf-test/doc-{i:03d}.md", 
+    # Establish pooled connections before timing so handshakes are not measured
+    db.warmup()
+
+    perf_batch = [
+        {
+            "path": f"/perf-test/doc-{i:03d}.md",
             "title": f"Performance Test Document {i}",
             "content": f"This is performance test document number {i}. " * 10,
             "tags": ["performance", "test", f"batch-{i//5}"]
-        })
-        perf_docs.append(doc_id)
-    
-    insert_time = time.time() - start_time
+        }
+        for i in range(10)
+    ]
+
+    # The first untimed insert detects whether the server has a bulk endpoint,
+    # so the timed batch below does not include that probe
+    db.insert_bulk(perf_batch[:1])
+    insert_mode = "bulk inserts" if db.bulk_supported else "sequential inserts (no bulk endpoint)"
+
+    # Quick performance test - one request per batch when the server supports it
+    with timed() as insert_samples:
+        perf_docs = db.insert_bulk(perf_batch[1:])
+    insert_ms = insert_samples[0] / 1e6
     
-    # Test query performance
-    start_time = time.time()
-    results = db.query("performance test", limit=20)
-    search_time = time.time() - start_time
+    # Test query performance - repeat the search to get a latency distribution
+    search_samples: List[int] = []
+    for _ in range(SEARCH_ITERATIONS):
+        with timed(search_samples):
+            results = db.query("performance test", limit=20)
+    p50, p95, p99 = latency_percentiles(search_samples)
     
     print(f"⚡ Performance:")
-    print(f"   - 10 inserts: {insert_time:.3f}s ({10/insert_time:.1f} ops/sec)")
-    print(f"   - 1 search: {search_time:.3f}s ({1000*search_time:.1f}ms)")
-    print(f"   - Found: {len(results.get('documents', []))} documents")
+    print(f"   - {len(perf_docs)} {insert_mode}: {insert_ms:.1f}ms ({len(perf_docs) / (insert_ms / 1000):.1f} docs/sec)")
+    print(f"   - {SEARCH_ITERATIONS} searches: p50 {p50:.1f}ms, p95 {p95:.1f}ms, p99 {p99:.1f}ms")
+    print(f"   - Found: {len(results.results)} documents")
     
     print("\n7️⃣ DATABASE STATISTICS")
     print("-" * 40)
@@ -251,5 +311,7 @@ let s2 = s;                     // ownership moves to s2
     print("   - Read docs: visit documentation")
     print("   - Build your app!")
 
+    db.close()
+
 if __name__ == "__main__":
     main()
\ No newline at end of file